@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import functools
+import operator
+import os
 import re
 import shutil
 import sys
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
 from typing import (
     Annotated,
@@ -13,7 +19,6 @@ from typing import (
     Optional,
     Pattern,
 )
-from urllib.parse import urlparse
 from xml.etree.ElementTree import Element
 
 import typer
@@ -21,7 +26,6 @@ from loguru import logger
 from pydantic import BaseModel, Field, field_validator
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, TaskID
 from rich.tree import Tree
 from typing_extensions import Self  # Python 3.11未満で必要
 
@@ -81,25 +85,35 @@ class LogManager:
             if not LOG_DIR.exists():
                 return
 
-            total_size = sum(f.stat().st_size for f in LOG_DIR.glob("*.log"))
-
-            if total_size > MAX_LOG_SIZE:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                archive_name = f"logs_until_{timestamp}"
-                archive_path = LOG_ARCHIVE_DIR / archive_name
+            # 1回のscandirでファイル名とサイズをまとめて収集する
+            log_names: list[str] = []
+            total_size = 0
+            with os.scandir(LOG_DIR) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".log") and entry.is_file():
+                        log_names.append(entry.name)
+                        total_size += entry.stat().st_size
+
+            # ログが上限以下なら何もせず戻る（通常ケース）
+            if total_size <= MAX_LOG_SIZE:
+                return
 
-                shutil.make_archive(
-                    str(archive_path),
-                    "zip",
-                    str(LOG_DIR),
-                    logger=logger,
-                )
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            archive_name = f"logs_until_{timestamp}"
+            archive_path = LOG_ARCHIVE_DIR / archive_name
+
+            shutil.make_archive(
+                str(archive_path),
+                "zip",
+                str(LOG_DIR),
+                logger=logger,
+            )
 
-                for log_file in LOG_DIR.glob("*.log"):
-                    if log_file.stem != f"conversion_{timestamp}":
-                        log_file.unlink()
+            for name in log_names:
+                if name != f"conversion_{timestamp}.log":
+                    (LOG_DIR / name).unlink()
 
-                logger.info(f"Archived old logs to: {archive_name}.zip")
+            logger.info(f"Archived old logs to: {archive_name}.zip")
 
         except Exception as e:
             logger.warning(f"Failed to cleanup logs: {e}")
@@ -131,7 +145,6 @@ class LogManager:
                 encoding=self.config.encoding,
                 backtrace=debug,
                 diagnose=debug,
-                enqueue=True,
             )
 
             # エラーログの設定（ターミナル出力）
@@ -199,6 +212,16 @@ class ResourceError(MarkdownError):
 # ==========================
 # 1. 設定モデル
 # ==========================
+@functools.lru_cache(maxsize=8)
+def _load_css_file(path: Path) -> str:
+    """CSSファイルを読み込む（パスごとに1回だけ）"""
+    try:
+        return path.read_text(encoding="utf-8")
+    except Exception as e:
+        logger.warning(f"Failed to load custom CSS: {e}")
+        return ""
+
+
 class ConfigModel(BaseModel):
     input_dir: Path
     output_dir: Path
@@ -232,18 +255,16 @@ class ConfigModel(BaseModel):
             raise ValueError(f"Custom CSS file not found: {v}")
         return v
 
-    def load_custom_css(self) -> str:
-        """カスタムCSSの読み込み"""
+    @functools.cached_property
+    def custom_css(self) -> str:
+        """カスタムCSS（初回アクセス時に読み込んでキャッシュ）"""
         if not self.custom_css_path:
             return ""
-        try:
-            return self.custom_css_path.read_text(encoding="utf-8")
-        except Exception as e:
-            logger.warning(f"Failed to load custom CSS: {e}")
-            return ""
+        return _load_css_file(self.custom_css_path)
 
-    def get_font_family(self) -> str:
-        """フォントファミリー設定の生成"""
+    @functools.cached_property
+    def font_family(self) -> str:
+        """フォントファミリー設定（初回アクセス時に生成してキャッシュ）"""
         fonts = [
             self.font_settings["primary"],
             self.font_settings["secondary"],
@@ -263,21 +284,47 @@ class ImagePattern:
     name: str
     patterns: tuple[Pattern[str], ...]
     css_class: str
+    literals: tuple[str, ...]
+    combined: Pattern[str] | None
     priority: int = 0
 
     @classmethod
     def compile(
         cls, name: str, patterns: list[str], css_class: str, priority: int = 0
     ) -> "ImagePattern":
-        """パターンをコンパイルしてImagePatternを作成"""
+        """パターンをコンパイルしてImagePatternを作成
+
+        メタ文字を含まないパターンはただの部分文字列照合で済むため
+        ``literals`` に分離し、残りだけを1つの正規表現に融合する。
+        """
+        literal_patterns = [p for p in patterns if re.escape(p) == p]
+        regex_patterns = [p for p in patterns if re.escape(p) != p]
         return cls(
             name=name,
             patterns=tuple(re.compile(p, re.IGNORECASE) for p in patterns),
             css_class=css_class,
+            literals=tuple(p.lower() for p in literal_patterns),
+            combined=(
+                re.compile(
+                    "|".join(f"(?:{p})" for p in regex_patterns), re.IGNORECASE
+                )
+                if regex_patterns
+                else None
+            ),
             priority=priority,
         )
 
 
+def _url_body(src: str) -> str:
+    """URLからクエリとフラグメントを除いた本体を小文字で返す
+
+    分類はサブ文字列の一致しか見ないため、RFC 3986の完全なパースは不要。
+    ``urlparse(...).path`` と違いホスト名も残るので、``gravatar.com`` の
+    ようなドメインパターンが絶対URLに対しても一致する。
+    """
+    return src.partition("?")[0].partition("#")[0].lower()
+
+
 class ImageConfig:
     """画像設定の管理クラス"""
 
@@ -316,6 +363,13 @@ class ImageConfig:
 
     def __init__(self, patterns: tuple[ImagePattern, ...] | None = None) -> None:
         self.patterns = patterns or self.DEFAULT_PATTERNS
+        self._sorted_patterns = tuple(
+            sorted(
+                self.patterns,
+                key=operator.attrgetter("priority"),
+                reverse=True,
+            )
+        )
         self._pattern_cache: dict[str, str] = {}
 
     def get_css_class(self, src: str) -> str:
@@ -327,12 +381,14 @@ class ImageConfig:
             return self._pattern_cache[src]
 
         try:
-            normalized_src = urlparse(src).path.lower()
-
-            for pattern in sorted(
-                self.patterns, key=lambda p: p.priority, reverse=True
-            ):
-                if any(p.search(normalized_src) for p in pattern.patterns):
+            normalized_src = _url_body(src)
+
+            for pattern in self._sorted_patterns:
+                # 部分文字列照合を先に試し、正規表現はその補完に使う
+                if any(lit in normalized_src for lit in pattern.literals) or (
+                    pattern.combined is not None
+                    and pattern.combined.search(normalized_src)
+                ):
                     self._pattern_cache[src] = pattern.css_class
                     return pattern.css_class
 
@@ -344,6 +400,17 @@ class ImageConfig:
             return "content-image"
 
 
+# 既定パターンでの分類はプロセス全体で共有・キャッシュする
+# （拡張はファイルごとに作り直されても、分類結果は使い回せる）
+_DEFAULT_IMAGE_CONFIG: Final[ImageConfig] = ImageConfig()
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_css_class(src: str) -> str:
+    """既定パターンによる画像URL分類（プロセス全体のLRUキャッシュ付き）"""
+    return _DEFAULT_IMAGE_CONFIG.get_css_class(src)
+
+
 class ImageClassExtension(Extension):
     """Markdown拡張: 画像クラスの処理"""
 
@@ -351,7 +418,7 @@ class ImageClassExtension(Extension):
         self, image_config: Optional[ImageConfig] = None, **kwargs: Any
     ) -> None:
         super().__init__(**kwargs)
-        self.image_config = image_config or ImageConfig()
+        self.image_config = image_config or _DEFAULT_IMAGE_CONFIG
 
     def extendMarkdown(self, md: markdown.Markdown) -> None:
         md.treeprocessors.register(
@@ -359,6 +426,11 @@ class ImageClassExtension(Extension):
         )
 
 
+# alt属性の属性リスト記法（{: size-xxx} など）用の正規表現を事前コンパイル
+_SIZE_RE: Final[Pattern[str]] = re.compile(r"\{:.*?size-(small|medium|large).*?\}")
+_ATTR_RE: Final[Pattern[str]] = re.compile(r"\{:.*?\}")
+
+
 class ImageClassTreeprocessor(Treeprocessor):
     """画像要素の処理"""
 
@@ -370,33 +442,45 @@ class ImageClassTreeprocessor(Treeprocessor):
         for elem in root.iter("img"):
             try:
                 self._process_image(elem)
-                logger.debug(
-                    "Processing image: src=%s, class=%s",
-                    elem.get("src", ""),
-                    elem.get("class", ""),
-                )
             except Exception as e:
                 logger.warning("Error processing image %s: %s", elem.get("src", ""), e)
 
     def _process_image(self, elem: Element) -> None:
         src = elem.get("src", "")
-        classes = set(filter(None, elem.get("class", "").split()))
-
-        css_class = self.image_config.get_css_class(src)
-        classes.add(css_class)
+        if self.image_config is _DEFAULT_IMAGE_CONFIG:
+            css_class = _cached_css_class(src)
+        else:
+            css_class = self.image_config.get_css_class(src)
 
         alt = elem.get("alt", "")
-        size_match = re.search(r"\{:.*?size-(small|medium|large).*?\}", alt)
+        size_match = _SIZE_RE.search(alt)
+        if size_match:
+            elem.set("alt", _ATTR_RE.sub("", alt).strip())
+
+        existing = elem.get("class", "")
+        if not existing:
+            # 大多数のケース: 既存クラスがなければset/sortを経ず直接設定する
+            # （分類クラスはいずれも辞書順で "img-" より前に来る）
+            if size_match:
+                css_class = f"{css_class} img-{size_match.group(1)}"
+            elem.set("class", css_class)
+            return
+
+        classes = set(existing.split())
+        classes.add(css_class)
         if size_match:
             classes.add(f"img-{size_match.group(1)}")
-            elem.set("alt", re.sub(r"\{:.*?\}", "", alt).strip())
-
         elem.set("class", " ".join(sorted(classes)))
 
 
 # ==========================
 # HTMLテンプレート生成
 # ==========================
+_DEFAULT_FONT_FAMILY: Final[str] = (
+    '"BIZ UDPGothic", "Hiragino Sans", "Noto Sans JP", sans-serif'
+)
+
+
 @dataclass(frozen=True)
 class HtmlTemplate:
     """HTMLテンプレート設定"""
@@ -405,10 +489,85 @@ class HtmlTemplate:
     content: str
     dark_mode: bool = False
     custom_css: str = ""
-    font_family: str = '"BIZ UDPGothic", "Hiragino Sans", "Noto Sans JP", sans-serif'
+    font_family: str = _DEFAULT_FONT_FAMILY
+    # Trueなら CSS/JS をインライン埋め込みせず style.css / theme.js を参照する
+    external_assets: bool = False
 
     def generate(self) -> str:
         """HTMLテンプレートを生成"""
+        prefix, middle, suffix = self._render_shell(
+            self.dark_mode,
+            self.custom_css,
+            self.font_family,
+            "" if self.external_assets else None,
+        )
+        return prefix + self.title + middle + self.content + suffix
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _render_shell(
+        dark_mode: bool,
+        custom_css: str,
+        font_family: str,
+        asset_prefix: str | None = None,
+    ) -> tuple[str, str, str]:
+        """タイトルと本文以外の共通シェルを構築（引数の組ごとにキャッシュ）
+
+        ファイルごとに変わるのはタイトルと本文だけなので、CSSを含む
+        巨大な固定部分は一度だけ組み立てて使い回す。
+        ``asset_prefix`` がNoneならCSS/JSをインラインで埋め込み、
+        文字列なら ``{asset_prefix}style.css`` / ``{asset_prefix}theme.js``
+        への参照タグを出力する。
+        """
+        base_css, theme_script = HtmlTemplate._build_assets(
+            custom_css, font_family
+        )
+
+        if asset_prefix is None:
+            style_block = f"""<style>
+{base_css}
+    </style>"""
+            script_block = f"""<script>
+{theme_script}
+    </script>"""
+        else:
+            style_block = (
+                f'<link rel="stylesheet" href="{asset_prefix}style.css"/>'
+            )
+            script_block = f'<script src="{asset_prefix}theme.js"></script>'
+
+        prefix = f"""<!DOCTYPE html>
+<html lang="ja" data-theme="{'dark' if dark_mode else 'light'}">
+<head>
+    <meta charset="UTF-8"/>
+    <meta name="viewport" content="width=device-width, initial-scale=1.0"/>
+    <title>"""
+
+        middle = f"""</title>
+    {style_block}
+</head>
+<body>
+    <div class="utility-buttons">
+        <button class="utility-button" onclick="window.print()" aria-label="印刷">
+            <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24">
+                <path d="M19 8H5c-1.66 0-3 1.34-3 3v6h4v4h12v-4h4v-6c0-1.66-1.34-3-3-3zm-3 11H8v-5h8v5zm3-7c-.55 0-1-.45-1-1s.45-1 1-1 1 .45 1 1-.45 1-1 1zm-1-9H6v4h12V3z"/>
+            </svg>
+        </button>
+        <button class="utility-button" onclick="toggleTheme()" aria-label="テーマ切り替え">🌓</button>
+    </div>
+    """
+
+        suffix = f"""
+    {script_block}
+</body>
+</html>"""
+
+        return prefix, middle, suffix
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _build_assets(custom_css: str, font_family: str) -> tuple[str, str]:
+        """ベースCSSとテーマ切替用JSを構築（引数の組ごとにキャッシュ）"""
         theme_script = """
         function toggleTheme() {
             const root = document.documentElement;
@@ -449,7 +608,7 @@ class HtmlTemplate:
         /* 基本スタイル */
         body {
             font-family: """
-            + self.font_family
+            + font_family
             + """;
             line-height: 1.8;
             color: var(--color-text);
@@ -639,36 +798,32 @@ class HtmlTemplate:
             }
         }
         """
-            + self.custom_css
+            + custom_css
         )
 
-        template = f"""<!DOCTYPE html>
-<html lang="ja" data-theme="{'dark' if self.dark_mode else 'light'}">
-<head>
-    <meta charset="UTF-8"/>
-    <meta name="viewport" content="width=device-width, initial-scale=1.0"/>
-    <title>{self.title}</title>
-    <style>
-{base_css}
-    </style>
-</head>
-<body>
-    <div class="utility-buttons">
-        <button class="utility-button" onclick="window.print()" aria-label="印刷">
-            <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24">
-                <path d="M19 8H5c-1.66 0-3 1.34-3 3v6h4v4h12v-4h4v-6c0-1.66-1.34-3-3-3zm-3 11H8v-5h8v5zm3-7c-.55 0-1-.45-1-1s.45-1 1-1 1 .45 1 1-.45 1-1 1zm-1-9H6v4h12V3z"/>
-            </svg>
-        </button>
-        <button class="utility-button" onclick="toggleTheme()" aria-label="テーマ切り替え">🌓</button>
-    </div>
-    {self.content}
-    <script>
-{theme_script}
-    </script>
-</body>
-</html>"""
+        return base_css, theme_script
 
-        return template
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _render_shell_bytes(
+        dark_mode: bool,
+        custom_css: str,
+        font_family: str,
+        asset_prefix: str | None = None,
+    ) -> tuple[bytes, bytes, bytes]:
+        """共通シェルをUTF-8バイト列で返す（ファイル書き出し用）
+
+        シェルは出力バイト数の大半を占めるため、一度だけエンコードして
+        使い回し、ファイルごとの再エンコードをタイトルと本文に限定する。
+        """
+        prefix, middle, suffix = HtmlTemplate._render_shell(
+            dark_mode, custom_css, font_family, asset_prefix
+        )
+        return (
+            prefix.encode("utf-8"),
+            middle.encode("utf-8"),
+            suffix.encode("utf-8"),
+        )
 
 
 def get_html_template(
@@ -685,10 +840,7 @@ def get_html_template(
         content=content,
         dark_mode=dark_mode,
         custom_css=custom_css,
-        font_family=(
-            font_family
-            or '"BIZ UDPGothic", "Hiragino Sans", "Noto Sans JP", sans-serif'
-        ),
+        font_family=font_family or _DEFAULT_FONT_FAMILY,
     )
     return template.generate()
 
@@ -702,6 +854,7 @@ class ConversionStatus:
 
     total: int = 0
     success: int = 0
+    skipped: int = 0
     errors: dict[Path, str] = field(default_factory=dict)
 
     @property
@@ -709,9 +862,30 @@ class ConversionStatus:
         return len(self.errors)
 
 
+# デフォルトの拡張セット（拡張インスタンスはモジュールで1つだけ作る）
+_DEFAULT_EXTENSIONS: Final[tuple[str | Extension, ...]] = (
+    "extra",
+    "nl2br",
+    "sane_lists",
+    "footnotes",
+    "tables",
+    ImageClassExtension(),  # 画像の自動クラス付与
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_converter() -> markdown.Markdown:
+    """デフォルト拡張セットのMarkdownインスタンスを生成（プロセスごとに1回）
+
+    拡張の登録や正規表現のコンパイルはインスタンス生成時にしか発生しないため、
+    ファイルごとに使い回して ``reset()`` で状態だけ初期化する。
+    """
+    return markdown.Markdown(extensions=list(_DEFAULT_EXTENSIONS))
+
+
 def convert_markdown_content(
     content: str,
-    extensions: list[str | Extension] | None = None,
+    extensions: Sequence[str | Extension] | None = None,
 ) -> str:
     """
     Markdownテキストを変換する共通関数
@@ -720,18 +894,12 @@ def convert_markdown_content(
         content: 変換するMarkdownテキスト
         extensions: 使用する拡張機能のリスト。デフォルトでは画像処理拡張を含む基本セット
     """
-    if extensions is None:
-        extensions = [
-            "extra",
-            "nl2br",
-            "sane_lists",
-            "footnotes",
-            "tables",
-            ImageClassExtension(),  # 画像の自動クラス付与
-        ]
-
     try:
-        return markdown.markdown(content, extensions=extensions)
+        if extensions is None:
+            md = _get_converter()
+            md.reset()
+            return md.convert(content)
+        return markdown.markdown(content, extensions=list(extensions))
     except Exception as e:
         logger.error(f"Markdown conversion error: {e}")
         msg = f"Failed to convert markdown: {e}"
@@ -739,38 +907,47 @@ def convert_markdown_content(
 
 
 def convert_markdown_to_html(
-    file_path: Path, status: ConversionStatus, progress: Progress, task: TaskID
-) -> None:
-    """単一ファイルの変換処理"""
+    file_path: Path, input_root: Path, output_root: Path
+) -> tuple[Path, str | None, bool]:
+    """単一ファイルの変換処理
+
+    読み込み・変換・書き出しまでを行い、
+    ``(相対パス, エラーまたはNone, スキップしたか)`` を返す。
+    RichのProgressには依存しないため、ワーカープロセスからそのまま呼べる。
+    出力先の親ディレクトリは呼び出し側で作成済みであること。
+    """
+    rel_path = file_path.relative_to(input_root)
     try:
-        # ファイルの存在確認
-        if not file_path.exists():
-            raise FileNotFoundError(f"Input file not found: {file_path}")
-
-        # Markdown変換
-        content = file_path.read_text(encoding="utf-8")
-        html_content = convert_markdown_content(content)
+        output_path = output_root / rel_path.with_suffix(".html")
 
-        # 出力パス設定と保存
-        base_path = str(file_path).replace("markdown", "html")
-        output_path = Path(base_path).with_suffix(".html")
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # 出力が入力より新しければ再変換は不要（インクリメンタルビルド）
+        if (
+            output_path.exists()
+            and output_path.stat().st_mtime >= file_path.stat().st_mtime
+        ):
+            return rel_path, None, True
 
-        full_html = get_html_template(file_path.stem, html_content)
-        output_path.write_text(full_html, encoding="utf-8")
+        content = file_path.read_bytes().decode("utf-8")
+        html_content = convert_markdown_content(content)
 
-        # 成功を記録
-        status.success += 1
-        logger.info("Successfully converted: %s", file_path.name)
+        # シェルはエンコード済みバイト列を使い回し、
+        # ファイル固有のタイトルと本文だけをエンコードする
+        # サブディレクトリの深さに応じて共有アセットへの相対パスを付ける
+        asset_prefix = "../" * (len(rel_path.parts) - 1)
+        prefix, middle, suffix = HtmlTemplate._render_shell_bytes(
+            False, "", _DEFAULT_FONT_FAMILY, asset_prefix
+        )
+        output_path.write_bytes(
+            prefix
+            + file_path.stem.encode("utf-8")
+            + middle
+            + html_content.encode("utf-8")
+            + suffix
+        )
+        return rel_path, None, False
 
     except Exception as e:
-        # エラーを記録
-        status.errors[file_path] = str(e)
-        logger.error("Failed to convert %s: %s", file_path, e)
-
-    finally:
-        # 進捗を更新
-        progress.advance(task)
+        return rel_path, str(e), False
 
 
 # ==========================
@@ -833,8 +1010,14 @@ def convert(
         output_dir = output_dir or Path("html")
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # ファイル検索
-        md_files = sorted(input_dir.glob("**/*.md"))
+        # ファイル検索（os.walkで文字列のまま走査し、該当ファイルだけPath化する）
+        md_files = [
+            Path(dirpath) / name
+            for dirpath, _, filenames in os.walk(input_dir)
+            for name in filenames
+            if name.endswith(".md")
+        ]
+        md_files.sort()
         if not md_files:
             logger.warning(f"No markdown files found in {input_dir}")
             raise typer.Exit(code=0) from None
@@ -856,35 +1039,57 @@ def convert(
             )
         )
 
-        # 変換処理
+        # 出力ディレクトリはループ前にまとめて作成（ファイルごとのmkdirを省く）
+        output_dirs = {
+            (output_dir / f.relative_to(input_dir)).parent for f in md_files
+        }
+        for directory in output_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+
+        # CSS/JSは全ページ共通なので、埋め込まずに1回だけ書き出して参照させる
+        base_css, theme_script = HtmlTemplate._build_assets(
+            "", _DEFAULT_FONT_FAMILY
+        )
+        (output_dir / "style.css").write_bytes(base_css.encode("utf-8"))
+        (output_dir / "theme.js").write_bytes(theme_script.encode("utf-8"))
+
+        # 変換はワーカープロセスで並列実行し、結果だけをメインプロセスで集約する
+        success_results: list[Path] = []
+        error_results: list[tuple[Path, str]] = []
+        # ワーカー側で読み込み→変換→書き出しまで完結するため、ディスク待ちは
+        # 他プロセスの変換と自然に重なる。プロセス間を行き来するのは結果タプル
+        # だけなので、タスクをまとめて送ってIPC往復を減らす
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            chunksize = max(1, len(md_files) // (max_workers * 4))
+            results = executor.map(
+                convert_markdown_to_html,
+                md_files,
+                repeat(input_dir),
+                repeat(output_dir),
+                chunksize=chunksize,
+            )
+
+            for file_path, (rel_path, error, skipped) in zip(md_files, results):
+                if skipped:
+                    status.skipped += 1
+                    logger.info(f"Skipped (up to date): {rel_path}")
+                elif error is None:
+                    status.success += 1
+                    success_results.append(rel_path)
+                    logger.info(f"Successfully converted: {rel_path}")
+                else:
+                    status.errors[file_path] = error
+                    error_results.append((rel_path, error))
+                    logger.error(f"Failed to convert {rel_path}: {error}")
+
+        # Richツリーの構築は結果が出揃ってからまとめて行う
         tree = Tree("[bold cyan]Conversion Status[/]")
         success_branch = tree.add("[green]Completed[/]")
         error_branch = tree.add("[red]Errors[/]")
-
-        for file_path in md_files:
-            try:
-                # 相対パスを維持した出力パスの生成
-                rel_path = file_path.relative_to(input_dir)
-                output_path = output_dir / rel_path.with_suffix(".html")
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # ファイル変換
-                content = file_path.read_text(encoding="utf-8")
-                html_content = convert_markdown_content(content)
-
-                full_html = get_html_template(file_path.stem, html_content)
-                output_path.write_text(full_html, encoding="utf-8")
-
-                # 成功を記録
-                status.success += 1
-                success_branch.add(f"[green]✓[/] {rel_path}")
-                logger.info(f"Successfully converted: {rel_path}")
-
-            except Exception as e:
-                # エラーを記録
-                status.errors[file_path] = str(e)
-                error_branch.add(f"[red]✗[/] {rel_path} - {str(e)}")
-                logger.error(f"Failed to convert {rel_path}: {e}")
+        for rel_path in success_results:
+            success_branch.add(f"[green]✓[/] {rel_path}")
+        for rel_path, error in error_results:
+            error_branch.add(f"[red]✗[/] {rel_path} - {error}")
 
         # 最終結果の表示
         console.print("\n")
@@ -898,6 +1103,7 @@ def convert(
                         "",
                         f"Total files processed: {status.total}",
                         f"Successfully converted: {status.success}",
+                        f"Skipped (up to date): {status.skipped}",
                         f"Failed to convert: {status.failed}",
                         "",
                         "[red]⚠️ Some files failed to convert[/]"
@@ -933,6 +1139,7 @@ Conversion Complete
 Finished at: {datetime.now():%Y-%m-%d %H:%M:%S}
 Total files: {status.total}
 Successful: {status.success}
+Skipped: {status.skipped}
 Failed: {status.failed}
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """)
@@ -978,8 +1185,15 @@ class MarkdownConverter:
             retention="7 days",
         )
 
-    def convert_file(self, file_path: Path) -> Optional[str]:
-        """1つのファイルを変換"""
+    def convert_file(
+        self, file_path: Path, input_root: Path, output_root: Path
+    ) -> Optional[str]:
+        """1つのファイルを変換
+
+        出力先は ``input_root`` からの相対パスを ``output_root`` 配下に
+        写して決定する（文字列置換によるパス変換はサブディレクトリ名を
+        壊すことがあるため使わない）。
+        """
         try:
             if not file_path.exists():
                 logger.error(f"Input file not found: {file_path}")
@@ -988,7 +1202,7 @@ class MarkdownConverter:
             content = file_path.read_text(encoding="utf-8")
             html_content = convert_markdown_content(content)
 
-            output_path = Path(str(file_path).replace("markdown", "html")).with_suffix(
+            output_path = output_root / file_path.relative_to(input_root).with_suffix(
                 ".html"
             )
             output_path.parent.mkdir(parents=True, exist_ok=True)